@@ -1,13 +1,11 @@
-import click
-import json
+import sys
 
-from pathlib import Path
+import click
 
 from cumulusci.core.config import ServiceConfig
 from cumulusci.core.exceptions import CumulusCIException, ServiceNotConfigured
 from cumulusci.core.utils import import_global, import_class
 from .runtime import pass_runtime
-from .ui import CliTable
 
 
 @click.group("service", help="Commands for connecting services to the keychain")
@@ -19,48 +17,45 @@ def service():
 @service.command(name="list", help="List services available for configuration and use")
 @click.option("--plain", is_flag=True, help="Print the table using plain ascii.")
 @click.option("--json", "print_json", is_flag=True, help="Print a json string")
-@pass_runtime(require_project=False, require_keychain=True)
+@pass_runtime(require_project=False)
 def service_list(runtime, plain, print_json):
     services = (
         runtime.project_config.services
         if runtime.project_config is not None
         else runtime.universal_config.services
     )
-    supported_service_types = list(services.keys())
-    supported_service_types.sort()
 
+    # The json output only describes the available services,
+    # so there is no need to decrypt the keychain for it.
     if print_json:
-        click.echo(json.dumps(services))
+        import json
+
+        json.dump(services, click.get_text_stream("stdout"))
+        click.echo()
         return None
 
+    from .ui import CliTable
+
+    runtime._load_keychain()
+    supported_service_types = sorted(services)
     configured_services = runtime.keychain.list_services()
+    default_services = runtime.keychain._default_services
     plain = plain or runtime.universal_config.cli__plain_output
 
     data = [["Type", "Name", "Default", "Description"]]
+    rows_to_dim = []
 
     for service_type in supported_service_types:
-        if service_type not in configured_services:
+        description = services[service_type]["description"]
+        default_service_for_type = default_services.get(service_type)
+        # unconfigured service types get a single, dimmed row with no name
+        for alias in configured_services.get(service_type) or [""]:
+            if not alias:
+                rows_to_dim.append(len(data))
             data.append(
-                [service_type, "", False, services[service_type]["description"]]
-            )
-            continue
-        for alias in configured_services[service_type]:
-            try:
-                default_service_for_type = runtime.keychain._default_services[
-                    service_type
-                ]
-            except KeyError:
-                default_service_for_type = None
-            data.append(
-                [
-                    service_type,
-                    alias,
-                    alias == default_service_for_type,
-                    services[service_type]["description"],
-                ]
+                [service_type, alias, alias == default_service_for_type, description]
             )
 
-    rows_to_dim = [row_index for row_index, row in enumerate(data) if not row[1]]
     table = CliTable(
         data,
         title="Services",
@@ -71,19 +66,35 @@ def service_list(runtime, plain, print_json):
     table.echo(plain)
 
 
+# Shared by every `service connect` subcommand
+SERVICE_NAME_ARGUMENT = click.Argument(["service_name"], required=False)
+
+
 class ConnectServiceCommand(click.MultiCommand):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._services_cache = None
+        self._params_cache = {}
+
     def _get_services_config(self, runtime):
-        return (
-            runtime.project_config.services
-            if runtime.project_config
-            else runtime.universal_config.services
-        )
+        # Click calls list_commands and get_command separately for the same
+        # runtime, so remember the services (and their sorted names) per runtime.
+        cache = self._services_cache
+        if cache is None or cache[0] is not runtime:
+            services = (
+                runtime.project_config.services
+                if runtime.project_config
+                else runtime.universal_config.services
+            )
+            cache = self._services_cache = (runtime, services, sorted(services))
+            self._params_cache = {}
+        return cache[1]
 
     def list_commands(self, ctx):
         """list the services that can be configured"""
         runtime = ctx.obj
-        services = self._get_services_config(runtime)
-        return sorted(services.keys())
+        self._get_services_config(runtime)
+        return list(self._services_cache[2])
 
     def _build_param(self, attribute, details):
         req = details["required"]
@@ -106,6 +117,13 @@ class ConnectServiceCommand(click.MultiCommand):
                     help="Set this service as the default for this project only.",
                 )
             )
+        options.append(
+            click.Option(
+                ("--force", "-f"),
+                is_flag=True,
+                help="Overwrite an existing service with the same name without confirmation.",
+            )
+        )
         return options
 
     def get_command(self, ctx, service_type):
@@ -120,11 +138,18 @@ class ConnectServiceCommand(click.MultiCommand):
                 f"Sorry, I don't know about the '{service_type}' service."
             )
 
-        attributes = service_config["attributes"].items()
-        params = [self._build_param(attr, cnfg) for attr, cnfg in attributes]
-        params.extend(self._get_default_options(runtime))
+        # The options only depend on the service's attributes,
+        # so they can be reused each time click asks for this command.
+        params = self._params_cache.get(service_type)
+        if params is None:
+            attributes = service_config["attributes"].items()
+            params = [self._build_param(attr, cnfg) for attr, cnfg in attributes]
+            params.extend(self._get_default_options(runtime))
+            params.append(SERVICE_NAME_ARGUMENT)
+            self._params_cache[service_type] = params
 
         def callback(*args, **kwargs):
+            force = kwargs.pop("force", False)
             service_name = kwargs.get("service_name")
             if not service_name:
                 click.echo(
@@ -132,11 +157,14 @@ class ConnectServiceCommand(click.MultiCommand):
                 )
                 service_name = "default"
 
-            configured_services = runtime.keychain.list_services()
-            if (
-                service_type in configured_services
-                and service_name in configured_services[service_type]
+            if not force and service_name in runtime.keychain.services.get(
+                service_type, {}
             ):
+                if not sys.stdin.isatty():
+                    raise click.UsageError(
+                        f"There is already a {service_type}:{service_name} service. "
+                        "Use --force to overwrite it."
+                    )
                 click.confirm(
                     f"There is already a {service_type}:{service_name} service. Do you want to overwrite it?",
                     abort=True,
@@ -149,9 +177,8 @@ class ConnectServiceCommand(click.MultiCommand):
 
             set_global_default = kwargs.pop("default", False)
 
-            serv_conf = dict(
-                (k, v) for k, v in list(kwargs.items()) if v is not None
-            )  # remove None values
+            # remove None values
+            serv_conf = {k: v for k, v in kwargs.items() if v is not None}
 
             # A service can define a callable to validate the service config
             validator_path = service_config.get("validator")
@@ -198,7 +225,6 @@ class ConnectServiceCommand(click.MultiCommand):
                     f"Service {service_type}:{service_name} is now the default for project '{project_name}'"
                 )
 
-        params.append(click.Argument(["service_name"], required=False))
         return click.Command(service_type, params=params, callback=callback)
 
 
@@ -217,20 +243,22 @@ def service_connect():
 @click.option("--plain", is_flag=True, help="Print the table using plain ascii.")
 @pass_runtime(require_project=False, require_keychain=True)
 def service_info(runtime, service_type, service_name, plain):
+    from .ui import CliTable
+
     try:
         plain = plain or runtime.universal_config.cli__plain_output
         service_config = runtime.keychain.get_service(service_type, service_name)
         service_data = [["Key", "Value"]]
         service_data.extend(
             [
-                [click.style(k, bold=True), str(v)]
+                [k if plain else click.style(k, bold=True), str(v)]
                 for k, v in service_config.config.items()
                 if k != "service_name"
             ]
         )
         wrap_cols = ["Value"] if not plain else None
-        default_service = runtime.keychain.get_default_service_name(service_type)
-        service_name = default_service if not service_name else service_name
+        if not service_name:
+            service_name = runtime.keychain.get_default_service_name(service_type)
         service_table = CliTable(
             service_data, title=f"{service_type}:{service_name}", wrap_cols=wrap_cols
         )
@@ -260,6 +288,8 @@ def service_default(runtime, service_type, service_name, project):
         click.echo(f"An error occurred setting the default service: {e}")
         return
     if project:
+        from pathlib import Path
+
         project_name = Path(runtime.keychain.project_local_dir).name
         click.echo(
             f"Service {service_type}:{service_name} is now the default for project '{project_name}'"
@@ -291,27 +321,30 @@ def service_rename(runtime, service_type, current_name, new_name):
 @pass_runtime(require_project=False, require_keychain=True)
 def service_remove(runtime, service_type, service_name):
     new_default = None
-    if len(
-        runtime.keychain.services.get(service_type, {}).keys()
-    ) > 2 and service_name == runtime.keychain._default_services.get(service_type):
+    keychain = runtime.keychain
+    services_of_type = keychain.services.get(service_type, {})
+    if len(services_of_type) > 2 and (
+        service_name == keychain._default_services.get(service_type)
+    ):
         click.echo(
             f"The service you would like to remove is currently the default for {service_type} services."
         )
         click.echo("Your other services of the same type are:")
-        for alias in runtime.keychain.list_services()[service_type]:
-            if alias != service_name:
-                click.echo(alias)
+        other_aliases = [
+            alias for alias in sorted(services_of_type) if alias != service_name
+        ]
+        click.echo("\n".join(other_aliases))
         new_default = click.prompt(
             "Enter the name of the service you would like as the new default"
         )
-        if new_default not in runtime.keychain.list_services()[service_type]:
+        if new_default not in other_aliases:
             click.echo(f"No service of type {service_type} with name: {new_default}")
             return
 
     try:
-        runtime.keychain.remove_service(service_type, service_name)
+        keychain.remove_service(service_type, service_name)
         if new_default:
-            runtime.keychain.set_default_service(service_type, new_default)
+            keychain.set_default_service(service_type, new_default)
     except ServiceNotConfigured as e:
         click.echo(f"An error occurred removing the service: {e}")
         return
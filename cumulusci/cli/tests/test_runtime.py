@@ -35,6 +35,14 @@ class TestCliRuntime(unittest.TestCase):
             self.assertIn(key, config.keychain.config)
         self.assertIn(config.project_config.repo_root, sys.path)
 
+    def test_load_keychain__only_once(self):
+        config = CliRuntime()
+        keychain = config.keychain
+
+        config._load_keychain()
+
+        self.assertIs(keychain, config.keychain)
+
     @mock.patch("cumulusci.cli.runtime.CliRuntime._load_project_config")
     def test_load_project_config_error(self, load_proj_cfg_mock):
         load_proj_cfg_mock.side_effect = ConfigError
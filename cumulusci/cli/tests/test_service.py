@@ -1,3 +1,4 @@
+import json
 from unittest import mock
 
 import click
@@ -9,7 +10,7 @@ from .. import service
 from .utils import run_click_command
 
 
-@mock.patch("cumulusci.cli.service.CliTable")
+@mock.patch("cumulusci.cli.ui.CliTable")
 def test_service_list__no_active_defaults(cli_tbl):
     runtime = mock.Mock()
     runtime.project_config.services = {
@@ -28,6 +29,7 @@ def test_service_list__no_active_defaults(cli_tbl):
         service.service_list, runtime=runtime, plain=False, print_json=False
     )
 
+    runtime._load_keychain.assert_called_once()
     cli_tbl.assert_called_with(
         [
             ["Type", "Name", "Default", "Description"],
@@ -43,7 +45,7 @@ def test_service_list__no_active_defaults(cli_tbl):
     )
 
 
-@mock.patch("cumulusci.cli.service.CliTable")
+@mock.patch("cumulusci.cli.ui.CliTable")
 def test_service_list(cli_tbl):
     runtime = mock.Mock()
     runtime.project_config.services = {
@@ -77,7 +79,7 @@ def test_service_list(cli_tbl):
     )
 
 
-@mock.patch("json.dumps")
+@mock.patch("json.dump")
 def test_service_list_json(json_):
     services = {
         "bad": {"description": "Unconfigured Service"},
@@ -92,7 +94,20 @@ def test_service_list_json(json_):
         service.service_list, runtime=runtime, plain=False, print_json=True
     )
 
-    json_.assert_called_with(services)
+    json_.assert_called_with(services, mock.ANY)
+    runtime._load_keychain.assert_not_called()
+
+
+def test_service_list_json__output(capsys):
+    services = {"test": {"description": "Test Service"}}
+    runtime = mock.Mock()
+    runtime.project_config.services = services
+
+    run_click_command(
+        service.service_list, runtime=runtime, plain=False, print_json=True
+    )
+
+    assert json.loads(capsys.readouterr().out) == services
 
 
 def test_service_connect__list_commands():
@@ -116,6 +131,44 @@ def test_service_connect__list_global_keychain():
     assert result == ["test"]
 
 
+def test_service_connect__services_cached_per_runtime():
+    multi_cmd = service.ConnectServiceCommand()
+    runtime = mock.Mock()
+    services = mock.PropertyMock(return_value={"test": {"attributes": {}}})
+    type(runtime.project_config).services = services
+
+    with click.Context(multi_cmd, obj=runtime) as ctx:
+        assert multi_cmd.list_commands(ctx) == ["test"]
+        multi_cmd.get_command(ctx, "test")
+    services.assert_called_once()
+
+    other_runtime = mock.Mock()
+    other_runtime.project_config.services = {"other": {}}
+    with click.Context(multi_cmd, obj=other_runtime) as ctx:
+        assert multi_cmd.list_commands(ctx) == ["other"]
+
+
+def test_service_connect__params_reused():
+    multi_cmd = service.ConnectServiceCommand()
+    runtime = mock.MagicMock()
+    runtime.project_config.services = {
+        "test": {"attributes": {"attr": {"required": False}}}
+    }
+
+    with click.Context(multi_cmd, obj=runtime) as ctx:
+        first = multi_cmd.get_command(ctx, "test")
+        second = multi_cmd.get_command(ctx, "test")
+
+    assert first.params is second.params
+    assert [param.name for param in first.params] == [
+        "attr",
+        "default",
+        "project",
+        "force",
+        "service_name",
+    ]
+
+
 def test_service_connect():
     multi_cmd = service.ConnectServiceCommand()
     runtime = mock.MagicMock()
@@ -132,6 +185,7 @@ def test_service_connect():
         cmd.callback(ctx.obj, project=False, service_name="test-alias")
 
 
+@mock.patch("sys.stdin.isatty", mock.Mock(return_value=True))
 @mock.patch("click.confirm")
 def test_service_connect__alias_already_exists(confirm):
     confirm.side_effect = "y"
@@ -141,8 +195,7 @@ def test_service_connect__alias_already_exists(confirm):
     runtime.project_config.services = {
         "test-type": {"attributes": {"attr": {"required": False}}}
     }
-    runtime.services = {"test-type": {"already-exists": "some config"}}
-    runtime.keychain.list_services.return_value = {"test-type": ["already-exists"]}
+    runtime.keychain.services = {"test-type": {"already-exists": "some config"}}
 
     with click.Context(multi_cmd, obj=runtime) as ctx:
         cmd = multi_cmd.get_command(ctx, "test-type")
@@ -156,6 +209,52 @@ def test_service_connect__alias_already_exists(confirm):
     confirm.assert_called_once()
 
 
+@mock.patch("click.confirm")
+def test_service_connect__alias_already_exists__force(confirm):
+    multi_cmd = service.ConnectServiceCommand()
+    runtime = mock.MagicMock()
+    runtime.project_config.services = {
+        "test-type": {"attributes": {"attr": {"required": False}}}
+    }
+    runtime.keychain.services = {"test-type": {"already-exists": "some config"}}
+
+    with click.Context(multi_cmd, obj=runtime) as ctx:
+        cmd = multi_cmd.get_command(ctx, "test-type")
+        cmd.callback(
+            runtime,
+            service_type="test-type",
+            service_name="already-exists",
+            force=True,
+        )
+
+    confirm.assert_not_called()
+    runtime.keychain.set_service.assert_called_once()
+    assert "force" not in runtime.keychain.set_service.call_args[0][2].config
+
+
+@mock.patch("sys.stdin.isatty", mock.Mock(return_value=False))
+@mock.patch("click.confirm")
+def test_service_connect__alias_already_exists__not_a_tty(confirm):
+    multi_cmd = service.ConnectServiceCommand()
+    runtime = mock.MagicMock()
+    runtime.project_config.services = {
+        "test-type": {"attributes": {"attr": {"required": False}}}
+    }
+    runtime.keychain.services = {"test-type": {"already-exists": "some config"}}
+
+    with click.Context(multi_cmd, obj=runtime) as ctx:
+        cmd = multi_cmd.get_command(ctx, "test-type")
+        with pytest.raises(click.UsageError, match="--force"):
+            cmd.callback(
+                runtime,
+                service_type="test-type",
+                service_name="already-exists",
+            )
+
+    confirm.assert_not_called()
+    runtime.keychain.set_service.assert_not_called()
+
+
 @mock.patch("click.echo")
 def test_service_connect__no_name_given(echo):
     multi_cmd = service.ConnectServiceCommand()
@@ -278,7 +377,7 @@ def test_service_connect_validator():
             )
 
 
-@mock.patch("cumulusci.cli.service.CliTable")
+@mock.patch("cumulusci.cli.ui.CliTable")
 def test_service_info(cli_tbl):
     cli_tbl._table = mock.Mock()
     service_config = mock.Mock()
@@ -300,6 +399,49 @@ def test_service_info(cli_tbl):
         title="test:test-alias",
         wrap_cols=["Value"],
     )
+    runtime.keychain.get_default_service_name.assert_not_called()
+
+
+@mock.patch("cumulusci.cli.ui.CliTable")
+def test_service_info__default_service(cli_tbl):
+    service_config = mock.Mock()
+    service_config.config = {"description": "Test Service"}
+    runtime = mock.Mock()
+    runtime.keychain.get_service.return_value = service_config
+    runtime.keychain.get_default_service_name.return_value = "default-alias"
+
+    run_click_command(
+        service.service_info,
+        runtime=runtime,
+        service_type="test",
+        service_name=None,
+        plain=True,
+    )
+
+    runtime.keychain.get_service.assert_called_once_with("test", None)
+    assert cli_tbl.call_args[1]["title"] == "test:default-alias"
+
+
+@mock.patch("cumulusci.cli.ui.CliTable")
+def test_service_info__plain(cli_tbl):
+    service_config = mock.Mock()
+    service_config.config = {"description": "Test Service"}
+    runtime = mock.Mock()
+    runtime.keychain.get_service.return_value = service_config
+
+    run_click_command(
+        service.service_info,
+        runtime=runtime,
+        service_type="test",
+        service_name="test-alias",
+        plain=True,
+    )
+
+    cli_tbl.assert_called_with(
+        [["Key", "Value"], ["description", "Test Service"]],
+        title="test:test-alias",
+        wrap_cols=None,
+    )
 
 
 @mock.patch("click.echo")
@@ -427,6 +569,7 @@ def test_service_remove(click):
     runtime.keychain.set_default_service.assert_called_once_with(
         "github", "future-default-alias"
     )
+    click.echo.assert_any_call("another-alias\nfuture-default-alias")
     assert (
         click.echo.call_args_list[-1][0][0]
         == "Service github:current-default-alias has been removed."
@@ -462,6 +605,34 @@ def test_service_remove__name_does_not_exist(click):
     assert runtime.keychain.set_default_service.call_count == 0
 
 
+@mock.patch("cumulusci.cli.service.click")
+def test_service_remove__new_default_is_removed_service(click):
+    click.prompt.side_effect = ("current-default-alias",)
+    runtime = mock.Mock()
+    runtime.keychain.services = {
+        "github": {
+            "current-default-alias": "config1",
+            "another-alias": "config2",
+            "future-default-alias": "config3",
+        }
+    }
+    runtime.keychain._default_services = {"github": "current-default-alias"}
+    runtime.keychain.list_services.return_value = {
+        "github": ["current-default-alias", "another-alias", "future-default-alias"]
+    }
+    run_click_command(
+        service.service_remove,
+        runtime=runtime,
+        service_type="github",
+        service_name="current-default-alias",
+    )
+    assert (
+        click.echo.call_args_list[-1][0][0]
+        == "No service of type github with name: current-default-alias"
+    )
+    assert runtime.keychain.remove_service.call_count == 0
+
+
 @mock.patch("cumulusci.cli.service.click")
 def test_service_remove__exception_thrown(click):
 
@@ -41,6 +41,7 @@ class OrgConfig(BaseConfig):
         self._community_info_cache = {}
         self._latest_api_version = None
         self._installed_packages = None
+        self._installed_version_ids = None
         self._is_person_accounts_enabled = None
         self._multiple_currencies_is_enabled = False
         super(OrgConfig, self).__init__(config)
@@ -294,8 +295,20 @@ class OrgConfig(BaseConfig):
             self._installed_packages = _installed_packages
         return self._installed_packages
 
+    @property
+    def installed_version_ids(self):
+        """installed_version_ids is the set of package version Ids (04t*) installed in the org."""
+        if self._installed_version_ids is None:
+            self._installed_version_ids = frozenset(
+                version_info.id
+                for versions in self.installed_packages.values()
+                for version_info in versions
+            )
+        return self._installed_version_ids
+
     def reset_installed_packages(self):
         self._installed_packages = None
+        self._installed_version_ids = None
 
     def save(self):
         assert self.keychain, "Keychain was not set on OrgConfig"
@@ -1184,6 +1184,21 @@ class TestOrgConfig(unittest.TestCase):
         assert config.installed_packages == expected
         sf.restful.assert_called()
 
+    @mock.patch("cumulusci.core.config.OrgConfig.salesforce_client")
+    def test_installed_version_ids(self, sf):
+        config = OrgConfig({}, "test")
+        sf.restful.side_effect = self.MOCK_TOOLING_PACKAGE_RESULTS
+
+        assert config.installed_version_ids == {
+            "04t1T00000070yqQAA",
+            "04t000000000001AAA",
+            "04t000000000002AAA",
+        }
+
+        config.reset_installed_packages()
+        config._installed_packages = {}
+        assert config.installed_version_ids == set()
+
     @mock.patch("cumulusci.core.config.OrgConfig.salesforce_client")
     def test_has_minimum_package_version(self, sf):
         config = OrgConfig({}, "test")
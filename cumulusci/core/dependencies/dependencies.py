@@ -1,8 +1,10 @@
 import abc
-import itertools
+import copy
 import logging
 import os
-from typing import List, Optional
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, FrozenSet, List, Optional
 
 import pydantic
 from github3.exceptions import NotFoundError
@@ -35,35 +37,62 @@ from cumulusci.utils.yaml.model_parser import CCIModel
 
 logger = logging.getLogger(__name__)
 
+# Flattening a resolved GitHub dependency only depends on the contents
+# of the repository at its ref, so results are remembered per project config.
+_flatten_cache = weakref.WeakKeyDictionary()
+
+# Shared by package installs that don't customize their options; never modified.
+_DEFAULT_PACKAGE_INSTALL_OPTIONS = PackageInstallOptions()
+
 
 def _validate_github_parameters(values):
-    if values.get("repo_owner") or values.get("repo_name"):
+    github = values.get("github")
+    repo_owner = values.get("repo_owner")
+    repo_name = values.get("repo_name")
+    if github and not (repo_owner or repo_name):
+        # The common case: there's nothing to warn about or populate.
+        return values
+
+    if repo_owner or repo_name:
         logger.warning(
             "The repo_name and repo_owner keys are deprecated. Please use the github key."
         )
 
-    assert values.get("github") or (
-        values.get("repo_owner") and values.get("repo_name")
+    assert github or (
+        repo_owner and repo_name
     ), "Must specify `github` or `repo_owner` and `repo_name`"
 
     # Populate the `github` property if not already populated.
-    if not values.get("github") and values.get("repo_name"):
-        values[
-            "github"
-        ] = f"https://github.com/{values['repo_owner']}/{values['repo_name']}"
+    if not github and repo_name:
+        values["github"] = f"https://github.com/{repo_owner}/{repo_name}"
         values.pop("repo_owner")
         values.pop("repo_name")
 
     return values
 
 
+def _hashable(value):
+    """Convert the list and dict field values of a model into tuples."""
+    if isinstance(value, list):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple((k, _hashable(v)) for k, v in sorted(value.items()))
+    return value
+
+
 class HashableBaseModel(CCIModel):
     """Base Pydantic model class that has a functional `hash()` method.
-    Requires that model can be converted to JSON."""
+    Requires that the model's field values are hashable, lists, or dicts."""
 
     # See https://github.com/samuelcolvin/pydantic/issues/1303
     def __hash__(self):
-        return hash((type(self),) + tuple(self.json()))
+        # Not cached: resolving a dependency assigns its `ref` after creation.
+        return hash((type(self),) + tuple(_hashable(v) for v in self.__dict__.values()))
+
+    def __copy__(self):
+        # Without this, copy.copy() goes through pydantic's pickle support
+        # and the copy shares its field values dict with the original.
+        return self.construct(_fields_set=set(self.__fields_set__), **self.__dict__)
 
 
 class Dependency(HashableBaseModel, abc.ABC):
@@ -250,24 +279,29 @@ class GitHubDynamicDependency(BaseGitHubDependency):
 
         return values
 
+    def _get_unpackaged_contents(
+        self, repo: Repository, subfolder: str
+    ) -> Optional[dict]:
+        """List a repository subfolder (such as unpackaged/pre or unpackaged/post), if it exists"""
+        try:
+            return repo.directory_contents(subfolder, return_as=dict, ref=self.ref)
+        except NotFoundError:
+            return None
+
     def _flatten_unpackaged(
         self,
-        repo: Repository,
+        contents: Optional[dict],
         subfolder: str,
-        skip: List[str],
+        skip: FrozenSet[str],
         managed: bool,
         namespace: Optional[str],
     ) -> List[StaticDependency]:
-        """Locate unmanaged dependencies from a repository subfolder (such as unpackaged/pre or unpackaged/post)"""
+        """Locate unmanaged dependencies from the listing of a repository subfolder"""
         unpackaged = []
-        try:
-            contents = repo.directory_contents(subfolder, return_as=dict, ref=self.ref)
-        except NotFoundError:
-            contents = None
-
         if contents:
+            prefix = f"{subfolder}/"
             for dirname in sorted(contents.keys()):
-                this_subfolder = f"{subfolder}/{dirname}"
+                this_subfolder = prefix + dirname
                 if this_subfolder in skip:
                     continue
 
@@ -300,12 +334,38 @@ class GitHubDynamicDependency(BaseGitHubDependency):
                 f"Dependency {self} is not resolved and cannot be flattened."
             )
 
+        # Return copies so that resolving the transitive dependencies
+        # doesn't change what's stored in the cache.
+        cache = _flatten_cache.setdefault(context, {})
+        if self not in cache:
+            # Key on a copy, since this dependency may be changed (e.g. resolved)
+            # after it is flattened and its hash would change with it.
+            cache[copy.copy(self)] = self._flatten(context)
+        return [copy.copy(dep) for dep in cache[self]]
+
+    def _flatten(self, context: BaseProjectConfig) -> List[Dependency]:
         deps = []
 
         context.logger.info(f"Collecting dependencies from Github repo {self.github}")
         repo = get_repo(self.github, context)
 
-        package_config = get_remote_project_config(repo, self.ref)
+        # These requests don't depend on each other, so make them concurrently.
+        # They share the repository's session, which is safe for these reads:
+        # none of them changes its auth or headers, and connections come from
+        # urllib3's thread-safe pool, which holds more than these three workers.
+        # Leaving the block joins the workers, even if submitting one fails.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            package_config_future = executor.submit(
+                get_remote_project_config, repo, self.ref
+            )
+            pre_future = executor.submit(
+                self._get_unpackaged_contents, repo, "unpackaged/pre"
+            )
+            post_future = executor.submit(
+                self._get_unpackaged_contents, repo, "unpackaged/post"
+            )
+
+        package_config = package_config_future.result()
         _, namespace = get_package_data(package_config)
 
         # Parse upstream dependencies from the repo's cumulusci.yml
@@ -321,12 +381,17 @@ class GitHubDynamicDependency(BaseGitHubDependency):
 
         # Check for unmanaged flag on a namespaced package
         managed = bool(namespace and not self.unmanaged)
+        skip = frozenset(self.skip)
 
         # Look for subfolders under unpackaged/pre
         # unpackaged/pre is always deployed unmanaged, no namespace manipulation.
         deps.extend(
             self._flatten_unpackaged(
-                repo, "unpackaged/pre", self.skip, managed=False, namespace=None
+                pre_future.result(),
+                "unpackaged/pre",
+                skip,
+                managed=False,
+                namespace=None,
             )
         )
 
@@ -355,15 +420,16 @@ class GitHubDynamicDependency(BaseGitHubDependency):
         # We always inject the project's namespace into unpackaged/post metadata if managed
         deps.extend(
             self._flatten_unpackaged(
-                repo,
+                post_future.result(),
                 "unpackaged/post",
-                self.skip,
+                skip,
                 managed=managed,
                 namespace=namespace,
             )
         )
 
-        return deps
+        # A repo may list the same upstream dependency more than once.
+        return list(dict.fromkeys(deps))
 
     @property
     def description(self):
@@ -392,17 +458,17 @@ class PackageNamespaceVersionDependency(StaticDependency):
         options: PackageInstallOptions = None,
         retry_options=None,
     ):
-        if not options:
-            options = PackageInstallOptions()
         if self.password_env_name:
+            options = options or PackageInstallOptions()
             options.password = os.environ.get(self.password_env_name)
+        elif not options:
+            options = _DEFAULT_PACKAGE_INSTALL_OPTIONS
         if not retry_options:
             retry_options = DEFAULT_PACKAGE_RETRY_OPTIONS
 
         if "Beta" in self.version:
-            version_string = self.version.split(" ")[0]
-            beta = self.version.split(" ")[-1].strip(")")
-            version = f"{version_string}b{beta}"
+            parts = self.version.split(" ")
+            version = f"{parts[0]}b{parts[-1].strip(')')}"
         else:
             version = self.version
 
@@ -454,17 +520,15 @@ class PackageVersionIdDependency(StaticDependency):
         options: PackageInstallOptions = None,
         retry_options=None,
     ):
-        if not options:
-            options = PackageInstallOptions()
         if self.password_env_name:
+            options = options or PackageInstallOptions()
             options.password = os.environ.get(self.password_env_name)
+        elif not options:
+            options = _DEFAULT_PACKAGE_INSTALL_OPTIONS
         if not retry_options:
             retry_options = DEFAULT_PACKAGE_RETRY_OPTIONS
 
-        if any(
-            self.version_id == v.id
-            for v in itertools.chain(*org.installed_packages.values())
-        ):
+        if self.version_id in org.installed_version_ids:
             context.logger.info(
                 f"{self} or a newer version is already installed; skipping."
             )
@@ -604,27 +668,36 @@ def parse_dependencies(deps: Optional[List[dict]]) -> List[Dependency]:
     return parsed_deps
 
 
-def parse_dependency(dep_dict: dict) -> Optional[Dependency]:
+# Keys that identify the class a dependency dict is parsed as, in order of precedence.
+# The order is significant. GitHubDynamicDependency has an optional `ref` field,
+# but we want any dependencies with a populated `ref` to be parsed as static deps.
+# Dicts that match none of these are parsed as a GitHubDynamicDependency.
+DEPENDENCY_CLASSES_BY_KEYS = [
+    (frozenset(["namespace", "version"]), PackageNamespaceVersionDependency),
+    (frozenset(["version_id"]), PackageVersionIdDependency),
+    (frozenset(["ref"]), UnmanagedGitHubRefDependency),
+    (frozenset(["zip_url"]), UnmanagedZipURLDependency),
+    (frozenset(["subfolder"]), GitHubDynamicSubfolderDependency),
+]
+
+
+def parse_dependency(dep_dict: Any) -> Optional[Dependency]:
     """Parse a single dependency specification in the form of a dict
     into a concrete Dependency subclass.
 
-    Returns None if the given dict cannot be parsed."""
+    Returns None if the given specification cannot be parsed."""
 
-    # The order in which we attempt parsing is significant.
-    # GitHubDynamicDependency has an optional `ref` field, but we want
-    # any dependencies with a populated `ref` to be parsed as static deps.
+    if not isinstance(dep_dict, dict):
+        return None
 
-    for dependency_class in [
-        PackageNamespaceVersionDependency,
-        PackageVersionIdDependency,
-        UnmanagedGitHubRefDependency,
-        UnmanagedZipURLDependency,
+    # Pick the one class that can match the dict's keys, rather than
+    # trying each class and paying for a ValidationError on every miss.
+    keys = dep_dict.keys()
+    dependency_class = next(
+        (cls for required, cls in DEPENDENCY_CLASSES_BY_KEYS if required <= keys),
         GitHubDynamicDependency,
-        GitHubDynamicSubfolderDependency,
-    ]:
-        try:
-            dep = dependency_class.parse_obj(dep_dict)
-            if dep:
-                return dep
-        except pydantic.ValidationError:
-            pass
+    )
+    try:
+        return dependency_class.parse_obj(dep_dict)
+    except pydantic.ValidationError:
+        return None
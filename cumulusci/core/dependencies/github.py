@@ -1,6 +1,7 @@
 import functools
 import io
 import re
+import weakref
 from typing import Optional
 
 from github3.git import Tag
@@ -16,7 +17,18 @@ PACKAGE_TYPE_RE = re.compile(r"^package_type: (.*)$", re.MULTILINE)
 VERSION_ID_RE = re.compile(r"^version_id: (04t[a-zA-Z0-9]{12,15})$", re.MULTILINE)
 
 
+# Resolving and flattening a dependency graph looks up the same repositories
+# many times; each lookup would otherwise log in and fetch the repo again.
+# Repositories are remembered per project config, so they (and the
+# credentials they carry) are released along with it.
+_repo_cache = weakref.WeakKeyDictionary()
+
+
 def get_repo(github: str, context: BaseProjectConfig) -> Repository:
+    repos = _repo_cache.setdefault(context, {})
+    if github in repos:
+        return repos[github]
+
     try:
         repo = context.get_repo_from_url(github)
     except NotFoundError:
@@ -26,9 +38,12 @@ def get_repo(github: str, context: BaseProjectConfig) -> Repository:
         raise DependencyResolutionError(
             f"We are unable to find the repository at {github}. Please make sure the URL is correct, that your GitHub user has read access to the repository, and that your GitHub personal access token includes the “repo” scope."
         )
+    repos[github] = repo
     return repo
 
 
+# github3 repositories compare and hash by their API URL,
+# so this is cached per (repository, ref).
 @functools.lru_cache(50)
 def get_remote_project_config(repo: Repository, ref: str) -> BaseConfig:
     contents = repo.file_contents("cumulusci.yml", ref=ref)
@@ -1,7 +1,7 @@
 import abc
-import itertools
+import copy
 from enum import Enum
-from typing import Callable, Iterable, List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 from github3.exceptions import NotFoundError
 
@@ -452,31 +452,39 @@ def get_static_dependencies(
     if filter_function is None:
         filter_function = lambda x: True
 
-    while any(not d.is_flattened or not d.is_resolved for d in dependencies):
-        for d in dependencies:
-            if isinstance(d, DynamicDependency) and not d.is_resolved:
-                d.resolve(context, strategies)
-
-        def unique(it: Iterable):
-            seen = set()
-
-            for each in it:
-                if each not in seen:
-                    seen.add(each)
-                    yield each
-
-        dependencies = list(
-            unique(
-                itertools.chain(
-                    *list(
-                        d.flatten(context) for d in dependencies if filter_function(d)
-                    )
-                ),
-            )
-        )
-
-    # Make sure, if we had no flattening or resolving to do, that we apply the ignore list.
-    return [d for d in dependencies if filter_function(d)]
+    # Expand the dependency tree depth-first using an explicit stack,
+    # so that each dependency is resolved and flattened only once and
+    # static dependencies come out in installation order.
+    static_dependencies = []
+    seen = set()
+    stack = list(reversed(dependencies))
+    while stack:
+        dependency = stack.pop()
+        # A dependency reached again through another path has already been
+        # filtered and has contributed its static dependencies.
+        if dependency in seen:
+            continue
+
+        if dependency.is_flattened and dependency.is_resolved:
+            seen.add(dependency)
+            if filter_function(dependency):
+                static_dependencies.append(dependency)
+            continue
+
+        # Resolving updates the dependency in place, so remember a copy
+        # of it as it was found as well as the resolved dependency.
+        seen.add(copy.copy(dependency))
+        if isinstance(dependency, DynamicDependency) and not dependency.is_resolved:
+            dependency.resolve(context, strategies)
+            if dependency in seen:
+                continue
+            seen.add(copy.copy(dependency))
+
+        # Filter only once resolved, so the filter sees the resolved ref.
+        if filter_function(dependency):
+            stack.extend(reversed(dependency.flatten(context)))
+
+    return static_dependencies
 
 
 def resolve_dependency(
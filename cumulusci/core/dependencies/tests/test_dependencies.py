@@ -1,4 +1,5 @@
 from distutils.version import StrictVersion
+import copy
 from typing import List, Optional, Tuple
 from unittest import mock
 import os
@@ -18,6 +19,7 @@ from cumulusci.core.dependencies.dependencies import (
     UnmanagedGitHubRefDependency,
     UnmanagedZipURLDependency,
     parse_dependency,
+    _DEFAULT_PACKAGE_INSTALL_OPTIONS,
 )
 from cumulusci.core.dependencies.resolvers import DependencyResolutionStrategy, Resolver
 from cumulusci.core.exceptions import DependencyResolutionError
@@ -74,6 +76,34 @@ class MockBadResolver(Resolver):
         raise DependencyResolutionError("Bad resolver")
 
 
+class TestHashableBaseModel:
+    def test_hash(self):
+        gh = GitHubDynamicDependency(
+            github="https://github.com/SFDO-Tooling/RootRepo",
+            skip=["unpackaged/pre/first"],
+        )
+        same = GitHubDynamicDependency(
+            github="https://github.com/SFDO-Tooling/RootRepo",
+            skip=["unpackaged/pre/first"],
+        )
+
+        assert hash(gh) == hash(same)
+        assert len({gh, same}) == 1
+
+        gh.ref = "aaaaa"
+        assert hash(gh) != hash(same)
+
+    def test_copy(self):
+        gh = GitHubDynamicDependency(github="https://github.com/SFDO-Tooling/RootRepo")
+        gh_copy = copy.copy(gh)
+
+        assert gh_copy == gh
+        assert hash(gh_copy) == hash(gh)
+
+        gh.ref = "aaaaa"
+        assert gh_copy.ref is None
+
+
 class TestDynamicDependency:
     @mock.patch("cumulusci.core.dependencies.resolvers.get_resolver")
     def test_dynamic_dependency(self, get_resolver):
@@ -253,6 +283,62 @@ class TestGitHubDynamicDependency:
             ),
         ]
 
+    def test_flatten__cached(self, project_config):
+        project_config.get_repo_from_url = mock.Mock(
+            wraps=project_config.get_repo_from_url
+        )
+        gh = GitHubDynamicDependency(github="https://github.com/SFDO-Tooling/RootRepo")
+        gh.ref = "aaaaa"
+        gh.managed_dependency = PackageNamespaceVersionDependency(
+            namespace="bar", version="2.0"
+        )
+
+        first = gh.flatten(project_config)
+        second = gh.flatten(project_config)
+
+        assert first == second
+        assert first[0] is not second[0]
+        project_config.get_repo_from_url.assert_called_once()
+
+    def test_flatten__cached_after_change(self, project_config):
+        gh = GitHubDynamicDependency(github="https://github.com/SFDO-Tooling/RootRepo")
+        gh.ref = "aaaaa"
+        original = copy.copy(gh)
+        flattened = [PackageNamespaceVersionDependency(namespace="bar", version="2.0")]
+
+        with mock.patch.object(
+            GitHubDynamicDependency, "_flatten", return_value=flattened
+        ) as _flatten:
+            gh.flatten(project_config)
+            gh.ref = "bbbbb"
+            assert original.flatten(project_config) == flattened
+
+        _flatten.assert_called_once_with(project_config)
+
+    def test_flatten__duplicates(self, project_config):
+        gh = GitHubDynamicDependency(github="https://github.com/SFDO-Tooling/RootRepo")
+        gh.ref = "aaaaa"
+        gh.managed_dependency = PackageNamespaceVersionDependency(
+            namespace="bar", version="2.0"
+        )
+        package_config = mock.Mock(
+            project__dependencies=[{"namespace": "foo", "version": "1.0"}] * 2
+        )
+
+        with mock.patch(
+            "cumulusci.core.dependencies.dependencies.get_remote_project_config",
+            return_value=package_config,
+        ), mock.patch(
+            "cumulusci.core.dependencies.dependencies.get_package_data",
+            return_value=("RootRepo", "bar"),
+        ):
+            deps = gh.flatten(project_config)
+
+        assert deps[0] == PackageNamespaceVersionDependency(
+            namespace="foo", version="1.0"
+        )
+        assert deps.count(deps[0]) == 1
+
     def test_flatten__skip(self, project_config):
         gh = GitHubDynamicDependency(
             github="https://github.com/SFDO-Tooling/RootRepo",
@@ -471,6 +557,8 @@ class TestPackageNamespaceVersionDependency:
 
         opts = install_package_by_namespace_version.call_args[0][4]
         assert opts.password == "testpw"
+        assert opts is not _DEFAULT_PACKAGE_INSTALL_OPTIONS
+        assert _DEFAULT_PACKAGE_INSTALL_OPTIONS.password is None
 
     def test_name(self):
         assert (
@@ -780,3 +868,14 @@ class TestParseDependency:
             }
         )
         assert isinstance(u, UnmanagedZipURLDependency)
+
+    def test_parse_subfolder_dependency(self):
+        d = parse_dependency(
+            {"github": "https://github.com/Test/TestRepo", "subfolder": "src"}
+        )
+        assert isinstance(d, GitHubDynamicSubfolderDependency)
+
+    def test_parse_dependency__invalid(self):
+        assert parse_dependency({"namespace": "foo"}) is None
+        assert parse_dependency({"version_id": "04t000000000000", "ref": "a"}) is None
+        assert parse_dependency("foo") is None
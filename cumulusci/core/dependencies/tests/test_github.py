@@ -1,4 +1,6 @@
 from unittest import mock
+import gc
+import weakref
 
 import pytest
 
@@ -28,12 +30,50 @@ project:
     assert isinstance(get_remote_project_config(repo, "aaaaaaaa"), BaseConfig)
 
 
+def test_get_remote_project_config__cached():
+    repo = mock.Mock()
+    repo.file_contents.return_value.decoded = b"project: {}"
+
+    config = get_remote_project_config(repo, "bbbbbbbb")
+    assert get_remote_project_config(repo, "bbbbbbbb") is config
+    repo.file_contents.assert_called_once_with("cumulusci.yml", ref="bbbbbbbb")
+
+
 def test_get_repo():
     context = mock.Mock()
 
     assert get_repo("test", context) == context.get_repo_from_url.return_value
 
 
+def test_get_repo__cached():
+    context = mock.Mock()
+
+    assert get_repo("test", context) is get_repo("test", context)
+    context.get_repo_from_url.assert_called_once_with("test")
+
+
+def test_get_repo__cached_per_context():
+    context = mock.Mock()
+    other_context = mock.Mock()
+
+    assert get_repo("test", context) is not get_repo("test", other_context)
+    other_context.get_repo_from_url.assert_called_once_with("test")
+
+
+def test_get_repo__releases_context():
+    # The cache must not keep the project config alive. (A Mock's own return
+    # value would refer back to its parent, so return an unrelated one.)
+    repo = mock.Mock()
+    context = mock.Mock()
+    context.get_repo_from_url.side_effect = lambda url: repo
+    assert get_repo("test", context) is repo
+
+    context_ref = weakref.ref(context)
+    del context
+    gc.collect()
+    assert context_ref() is None
+
+
 def test_get_repo__failure():
     context = mock.Mock()
     context.get_repo_from_url.return_value = None
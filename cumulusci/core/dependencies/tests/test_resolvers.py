@@ -548,6 +548,94 @@ class TestStaticDependencyResolution:
             ),
         ]
 
+    def test_get_static_dependencies__duplicates(self, project_config):
+        gh = GitHubDynamicDependency(github="https://github.com/SFDO-Tooling/RootRepo")
+        pkg = PackageNamespaceVersionDependency(namespace="bar", version="2.0")
+
+        result = get_static_dependencies(
+            project_config,
+            dependencies=[pkg, gh, pkg],
+            strategies=[DependencyResolutionStrategy.RELEASE_TAG],
+        )
+
+        assert result[0] == pkg
+        assert len(result) == len(set(result)) == 8
+
+    def test_get_static_dependencies__resolves_once(self, project_config):
+        resolve = GitHubDynamicDependency.resolve
+        deps = [
+            GitHubDynamicDependency(github="https://github.com/SFDO-Tooling/RootRepo")
+            for _ in range(2)
+        ]
+
+        with mock.patch.object(
+            GitHubDynamicDependency, "resolve", autospec=True, side_effect=resolve
+        ) as resolve_mock:
+            result = get_static_dependencies(
+                project_config,
+                dependencies=deps,
+                strategies=[DependencyResolutionStrategy.RELEASE_TAG],
+            )
+
+        assert len(result) == 7
+        # RootRepo and its dependency, DependencyRepo
+        assert resolve_mock.call_count == 2
+
+    def test_get_static_dependencies__filter_sees_resolved(self, project_config):
+        filtered = []
+
+        def record(dependency):
+            if isinstance(dependency, GitHubDynamicDependency):
+                filtered.append((dependency.github, dependency.ref))
+            return True
+
+        get_static_dependencies(
+            project_config,
+            dependencies=[
+                GitHubDynamicDependency(
+                    github="https://github.com/SFDO-Tooling/RootRepo"
+                )
+                for _ in range(2)
+            ],
+            strategies=[DependencyResolutionStrategy.RELEASE_TAG],
+            filter_function=record,
+        )
+
+        assert filtered == [
+            ("https://github.com/SFDO-Tooling/RootRepo", "tag_sha"),
+            ("https://github.com/SFDO-Tooling/DependencyRepo", "tag_sha"),
+        ]
+
+    def test_get_static_dependencies__filter_skips_resolved_duplicates(
+        self, project_config
+    ):
+        filtered = []
+
+        def record(dependency):
+            if isinstance(dependency, GitHubDynamicDependency):
+                filtered.append((dependency.github, dependency.ref))
+            return True
+
+        unresolved = GitHubDynamicDependency(
+            github="https://github.com/SFDO-Tooling/RootRepo"
+        )
+        resolved = GitHubDynamicDependency(
+            github="https://github.com/SFDO-Tooling/RootRepo"
+        )
+        resolved.resolve(project_config, [DependencyResolutionStrategy.RELEASE_TAG])
+
+        get_static_dependencies(
+            project_config,
+            dependencies=[unresolved, resolved],
+            strategies=[DependencyResolutionStrategy.RELEASE_TAG],
+            filter_function=record,
+        )
+
+        assert filtered == [
+            ("https://github.com/SFDO-Tooling/RootRepo", "tag_sha"),
+            ("https://github.com/SFDO-Tooling/DependencyRepo", "tag_sha"),
+        ]
+
     def test_get_static_dependencies__ignore_namespace(self, project_config):
         gh = GitHubDynamicDependency(github="https://github.com/SFDO-Tooling/RootRepo")
 
@@ -178,24 +178,18 @@ class EncryptedFileProjectKeychain(BaseProjectKeychain):
             return Path(self.project_local_dir) / "DEFAULT_ORG.txt"
 
     def _load_orgs(self) -> None:
-        self._load_org_files(self.global_config_dir, GlobalOrg)
-        self._load_org_files(self.project_local_dir, LocalOrg)
-
-    def _load_org_files(self, dirname: str, constructor=None):
-        """Loads .org files in a given directory onto the keychain"""
-        if not dirname:
-            return
-        dir_path = Path(dirname)
-        for item in sorted(dir_path.iterdir()):
-            if item.suffix == ".org":
-                with open(item, "r") as f:
-                    config = f.read()
-                name = item.name.replace(".org", "")
-                if "orgs" not in self.config:
-                    self.config["orgs"] = {}
-                self.config["orgs"][name] = (
-                    constructor(config) if constructor else config
-                )
+        """Finds .org files in the global and project directories.
+        Project orgs are loaded last so that they take precedence.
+        The files themselves are only read when an org is requested."""
+        orgs = self.config.setdefault("orgs", {})
+        for dirname, constructor in (
+            (self.global_config_dir, GlobalOrg),
+            (self.project_local_dir, LocalOrg),
+        ):
+            if not dirname:
+                continue
+            for item in sorted(Path(dirname).glob("*.org")):
+                orgs[item.stem] = constructor(item)
 
     def _set_org(self, org_config, global_org):
         if org_config.keychain:
@@ -479,19 +473,11 @@ class EncryptedFileProjectKeychain(BaseProjectKeychain):
         in ~/.cumulusci/services looking for .service files to load.
         """
         services_dir = Path(f"{self.global_config_dir}/services")
-        for item in services_dir.glob("**/*"):
-            if item.suffix == ".service":
-                with open(item) as f:
-                    config = f.read()
-                if "services" not in self.config:
-                    self.config["services"] = {}
-                name = item.name.replace(".service", "")
-                service_type = item.parent.name
-                if service_type not in self.config["services"]:
-                    self.config["services"][service_type] = {}
-                self.config["services"][service_type][name] = (
-                    constructor(config) if constructor else config
-                )
+        services = self.config.setdefault("services", {})
+        for item in services_dir.glob("**/*.service"):
+            config = item.read_bytes()
+            services_of_type = services.setdefault(item.parent.name, {})
+            services_of_type[item.stem] = constructor(config) if constructor else config
 
     def _load_default_services(self) -> None:
         """Init self._default_services on the keychain so that
@@ -717,10 +703,19 @@ class EncryptedFileProjectKeychain(BaseProjectKeychain):
 
 
 class GlobalOrg(T.NamedTuple):
-    encrypted_data: bytes
+    path: Path
     global_org: bool = True
 
+    @property
+    def encrypted_data(self) -> bytes:
+        # Read on demand so that loading the keychain doesn't read every org file
+        return self.path.read_bytes()
+
 
 class LocalOrg(T.NamedTuple):
-    encrypted_data: bytes
+    path: Path
     global_org: bool = False
+
+    @property
+    def encrypted_data(self) -> bytes:
+        return self.path.read_bytes()
@@ -77,6 +77,19 @@ class TestEncryptedFileProjectKeychain:
         assert "foo" in keychain.get_org("test").config
         assert keychain.get_org("test").keychain == keychain
 
+    def test_load_orgs__reads_files_on_demand(self, keychain):
+        org_path = Path(keychain.global_config_dir, "test.org")
+        self._write_file(
+            org_path,
+            keychain._encrypt_config(BaseConfig({"foo": "bar"})).decode("utf-8"),
+        )
+
+        with mock.patch.object(Path, "read_bytes") as read_bytes:
+            keychain._load_orgs()
+        read_bytes.assert_not_called()
+        assert keychain.orgs["test"] == GlobalOrg(org_path)
+        assert "foo" in keychain.get_org("test").config
+
     def test_remove_org(self, keychain, org_config):
         keychain.set_org(org_config)
         keychain.remove_org("test")
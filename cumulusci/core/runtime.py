@@ -19,6 +19,7 @@ class BaseCumulusCI(object):
         self.universal_config = None
         self.project_config = None
         self.keychain = None
+        self._keychain_loaded = False
         self.debug_mode = get_debug_mode()
 
         self._load_universal_config()
@@ -79,12 +80,17 @@ class BaseCumulusCI(object):
         )
 
     def _load_keychain(self):
+        # Commands and click's subcommand lookup may each ask for the keychain;
+        # only read and decrypt it the first time.
+        if self._keychain_loaded:
+            return
         keychain_key = self.keychain_key if self.keychain_cls.encrypted else None
         if self.project_config is None:
             self.keychain = self.keychain_cls(self.universal_config, keychain_key)
         else:
             self.keychain = self.keychain_cls(self.project_config, keychain_key)
             self.project_config.keychain = self.keychain
+        self._keychain_loaded = True
 
     def get_flow(self, name, options=None):
         """Get a primed and readytogo flow coordinator."""
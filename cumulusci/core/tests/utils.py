@@ -97,10 +97,15 @@ class EnvironmentVarGuard(collections.abc.MutableMapping):
 
 
 class MockLoggerMixin(object):
+    # One handler is shared by every TestCase that uses the mixin, so the
+    # task logger's handler list doesn't grow with each test class.
+    _task_log_handler = MockLoggingHandler(logging.DEBUG)
+
     @classmethod
     def setUpClass(cls):
         super(MockLoggerMixin, cls).setUpClass()
         logger = logging.getLogger(cumulusci.core.tasks.__name__)
         logger.setLevel(logging.DEBUG)
-        cls._task_log_handler = MockLoggingHandler(logging.DEBUG)
-        logger.addHandler(cls._task_log_handler)
+        if cls._task_log_handler not in logger.handlers:
+            logger.addHandler(cls._task_log_handler)
+        cls._task_log_handler.reset()
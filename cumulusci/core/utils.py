@@ -13,11 +13,9 @@ from cumulusci.core.exceptions import ConfigMergeError, TaskOptionsError
 
 def import_global(path):
     """Import a class from a string module class path"""
-    components = path.split(".")
-    module = components[:-1]
-    module = ".".join(module)
-    mod = __import__(module, fromlist=[str(components[-1])])
-    return getattr(mod, str(components[-1]))
+    module, name = path.rsplit(".", 1)
+    mod = __import__(module, fromlist=[name])
+    return getattr(mod, name)
 
 
 # For backwards-compatibility
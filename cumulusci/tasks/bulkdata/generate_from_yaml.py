@@ -1,5 +1,5 @@
+import io
 import os
-from typing import Optional
 from pathlib import Path
 import shutil
 from contextlib import contextmanager
@@ -86,39 +86,50 @@ class GenerateDataFromYaml(BaseGenerateDataTask):
 
             self.stopping_criteria = (num_records, num_records_tablename)
         self.working_directory = self.options.get("working_directory")
-        loading_rules = process_list_arg(self.options.get("loading_rules")) or []
-        self.loading_rules = [Path(path) for path in loading_rules if path]
+        loading_rules = process_list_arg(self.options.get("loading_rules"))
+        self.loading_rules = (
+            [Path(path) for path in loading_rules if path] if loading_rules else []
+        )
 
     def _generate_data(self, db_url, mapping_file_path, num_records, current_batch_num):
         """Generate all of the data"""
         if num_records is not None:  # num_records is None means execute Snowfakery once
             self.logger.info(f"Generating batch {current_batch_num} with {num_records}")
         self.generate_data(db_url, num_records, current_batch_num)
-        self.logger.info("Generated batch")
 
     def default_continuation_file_path(self):
         return Path(self.working_directory) / "continuation.yml"
 
-    def get_old_continuation_file(self) -> Optional[Path]:
-        """Use a continuation file if specified or look for one in the working directory
+    @contextmanager
+    def open_old_continuation_file(self):
+        """Open a continuation file if specified or look for one in the working directory
 
-        Return None if no file can be found.
+        Yield None if no file can be found. The file is closed again once data
+        generation has finished with it.
 
         If this code is used within a GenerateAndLoad loop, the continuation files will go
         into the working directory specified by the GenerateAndLoad caller.
         """
-        old_continuation_file = self.options.get("continuation_file")
+        if self.options.get("continuation_file"):
+            old_continuation_file = Path(self.options["continuation_file"])
+        elif self.working_directory:
+            old_continuation_file = self.default_continuation_file_path()
+        else:
+            yield None
+            return
 
-        if old_continuation_file:
-            old_continuation_file = Path(old_continuation_file)
-            if not old_continuation_file.exists():
+        try:
+            f = open(old_continuation_file, "r")
+        except FileNotFoundError:
+            if self.options.get("continuation_file"):
                 raise TaskOptionsError(f"{old_continuation_file} does not exist")
-        elif self.working_directory:
-            path = self.default_continuation_file_path()
-            if path.exists():
-                old_continuation_file = path
+            f = None
 
-        return old_continuation_file
+        if f is None:
+            yield None
+        else:
+            with f:
+                yield f
 
     @contextmanager
     def open_new_continuation_file(self):
@@ -131,42 +142,36 @@ class GenerateDataFromYaml(BaseGenerateDataTask):
         """
         if self.options.get("generate_continuation_file"):
             continuation_path = self.options["generate_continuation_file"]
-
-        elif self.working_directory:
-            continuation_path = Path(self.working_directory) / "continuation_next.yml"
-        else:
-            continuation_path = None
-
-        if continuation_path:
             with open(continuation_path, "w+") as new_continuation_file:
                 yield new_continuation_file
+        elif self.working_directory:
+            # buffered in memory and written straight to the default path
+            yield io.StringIO()
         else:
             yield None
 
     def generate_data(self, dburl, num_records, current_batch_num):
-        old_continuation_file = self.get_old_continuation_file()
-        if old_continuation_file:
-            # reopen to ensure file pointer is at starting point
-            old_continuation_file = open(old_continuation_file, "r")
-        with self.open_new_continuation_file() as new_continuation_file:
-            generate_data(
-                yaml_file=self.yaml_file,
-                user_options=self.vars,
-                target_number=self.stopping_criteria,
-                continuation_file=old_continuation_file,
-                generate_continuation_file=new_continuation_file,
-                generate_cci_mapping_file=self.generate_mapping_file,
-                dburl=dburl,
-                load_declarations=self.loading_rules,
-                should_create_cci_record_type_tables=True,
-                plugin_options={"orgname": self.org_config.name},
-            )
-
-        if (
-            new_continuation_file
-            and Path(new_continuation_file.name).exists()
-            and self.working_directory
-        ):
-            shutil.move(
-                new_continuation_file.name, self.default_continuation_file_path()
-            )
+        with self.open_old_continuation_file() as old_continuation_file:
+            with self.open_new_continuation_file() as new_continuation_file:
+                generate_data(
+                    yaml_file=self.yaml_file,
+                    user_options=self.vars,
+                    target_number=self.stopping_criteria,
+                    continuation_file=old_continuation_file,
+                    generate_continuation_file=new_continuation_file,
+                    generate_cci_mapping_file=self.generate_mapping_file,
+                    dburl=dburl,
+                    load_declarations=self.loading_rules,
+                    should_create_cci_record_type_tables=True,
+                    plugin_options={"orgname": self.org_config.name},
+                )
+
+        if new_continuation_file is not None and self.working_directory:
+            if isinstance(new_continuation_file, io.StringIO):
+                self.default_continuation_file_path().write_text(
+                    new_continuation_file.getvalue()
+                )
+            elif Path(new_continuation_file.name).exists():
+                shutil.move(
+                    new_continuation_file.name, self.default_continuation_file_path()
+                )
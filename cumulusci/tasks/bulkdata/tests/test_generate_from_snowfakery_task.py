@@ -92,6 +92,24 @@ class TestGenerateFromDataTask(unittest.TestCase):
             )
             task()
 
+    def test_generator_yaml_symlink_not_followed(self):
+        with TemporaryDirectory() as tmpdirname:
+            link = Path(tmpdirname) / "recipe.yml"
+            link.symlink_to(sample_yaml.absolute())
+            task = _make_task(
+                GenerateDataFromYaml,
+                {
+                    "options": {
+                        "generator_yaml": str(link),
+                        "generate_mapping_file": "mapping.yml",
+                        "num_records": 10,
+                        "num_records_tablename": "Account",
+                    }
+                },
+            )
+            assert task.yaml_file == str(link)
+            assert task.generate_mapping_file == str(Path("mapping.yml").absolute())
+
     def test_vars(self):
         with temp_sqlite_database_url() as database_url:
             with self.assertWarns(UserWarning):
@@ -317,6 +335,46 @@ class TestGenerateFromDataTask(unittest.TestCase):
             continuation_file = yaml.safe_load(open(temp_continuation_file))
             assert continuation_file  # internals of this file are not important to CumulusCI
 
+    def test_generate_continuation_file__working_directory(self):
+        with TemporaryDirectory() as working_directory:
+            with temp_sqlite_database_url() as database_url:
+                task = _make_task(
+                    GenerateDataFromYaml,
+                    {
+                        "options": {
+                            "generator_yaml": sample_yaml,
+                            "database_url": database_url,
+                            "working_directory": working_directory,
+                        }
+                    },
+                )
+                task()
+            continuation_file = Path(working_directory) / "continuation.yml"
+            assert yaml.safe_load(continuation_file.read_text())
+            assert not (Path(working_directory) / "continuation_next.yml").exists()
+
+    def test_generate_continuation_file__reuses_working_directory(self):
+        with TemporaryDirectory() as working_directory:
+            with temp_sqlite_database_url() as database_url:
+                options = {
+                    "generator_yaml": sample_yaml,
+                    "database_url": database_url,
+                    "working_directory": working_directory,
+                }
+                _make_task(GenerateDataFromYaml, {"options": options})()
+                continuation_file = Path(working_directory) / "continuation.yml"
+                first_continuation = continuation_file.read_text()
+
+                task = _make_task(GenerateDataFromYaml, {"options": options})
+                with mock.patch(
+                    "cumulusci.tasks.bulkdata.generate_from_yaml.generate_data"
+                ) as gen:
+                    task()
+                old_continuation_file = gen.call_args[1]["continuation_file"]
+                assert old_continuation_file.name == str(continuation_file)
+                assert old_continuation_file.closed
+                assert first_continuation
+
     def _get_mapping_file(self, **options):
         with temporary_file_path("mapping.yml") as temp_mapping:
             with temp_sqlite_database_url() as database_url:
@@ -1,6 +1,7 @@
 import json
 import pytest
 import re
+import requests
 import responses
 import zipfile
 
@@ -11,7 +12,6 @@ from cumulusci.core.config import TaskConfig
 from cumulusci.core.exceptions import DeploymentException
 from cumulusci.tasks.marketing_cloud.deploy import MarketingCloudDeployTask
 from cumulusci.tasks.marketing_cloud.deploy import MCPM_ENDPOINT
-from cumulusci.utils import temporary_dir
 
 
 @pytest.fixture
@@ -73,6 +73,9 @@ class TestMarketingCloudDeployTask:
         task.logger.info.assert_called_with("Deployment completed successfully.")
         assert task.logger.error.call_count == 0
         assert task.logger.warn.call_count == 0
+        for call in responses.calls:
+            assert call.request.headers["Authorization"] == "Bearer foo"
+            assert call.request.headers["SFMC-TSSD"] == "bar"
 
     @responses.activate
     def test_run_task__deploy_succeeds_without_custom_inputs(
@@ -117,17 +120,14 @@ class TestMarketingCloudDeployTask:
             },
         )
         task.logger = mock.Mock()
-        with pytest.raises(DeploymentException):
-            task._run_task()
+        with mock.patch.object(requests.Session, "close") as close:
+            with pytest.raises(DeploymentException):
+                task._run_task()
+        close.assert_called_once()
 
-        assert task.logger.error.call_count == 2
-        assert (
-            task.logger.error.call_args_list[0][0][0]
-            == "Failed to deploy assets/0. Status: FAILED. Issues: ['A problem occurred']"
-        )
-        assert (
-            task.logger.error.call_args_list[1][0][0]
-            == "Failed to deploy assets/1. Status: SKIPPED. Issues: ['A problem occurred']"
+        task.logger.error.assert_called_once_with(
+            "Failed to deploy assets/0. Status: FAILED. Issues: ['A problem occurred']\n"
+            "Failed to deploy assets/1. Status: SKIPPED. Issues: ['A problem occurred']"
         )
 
     def test_zipfile_not_valid(self, task):
@@ -141,10 +141,8 @@ class TestMarketingCloudDeployTask:
 
     def test_construct_payload(self, task):
         pkg_zip_file = Path(task.options["package_zip_file"])
-        with temporary_dir() as temp_dir:
-            with zipfile.ZipFile(pkg_zip_file) as zf:
-                zf.extractall(temp_dir)
-                actual_payload = task._construct_payload(Path(temp_dir))
+        with zipfile.ZipFile(pkg_zip_file) as zf:
+            actual_payload = task._construct_payload(zf)
 
         expected_payload_file = (
             Path(__file__).parent.absolute() / "expected-payload.json"
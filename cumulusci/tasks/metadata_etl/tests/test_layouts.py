@@ -1,3 +1,8 @@
+import copy
+
+import pytest
+from lxml import etree
+
 from cumulusci.tasks.salesforce.tests.util import create_task
 
 from cumulusci.tasks.metadata_etl import AddRelatedLists
@@ -6,6 +11,19 @@ from cumulusci.utils.xml import metadata_tree
 
 
 MD = "{%s}" % metadata_tree.METADATA_NAMESPACE
+RELATED_LIST_TEST_XPATH = f".//{MD}relatedLists[{MD}relatedList='TEST']"
+
+
+def _related_list_text(child):
+    return etree.XPath(
+        f".//sf:relatedLists[sf:relatedList='TEST']/sf:{child}/text()",
+        namespaces={"sf": metadata_tree.METADATA_NAMESPACE},
+    )
+
+
+RELATED_LIST_FIELDS_TEXT = _related_list_text("fields")
+RELATED_LIST_EXCLUDE_BUTTONS_TEXT = _related_list_text("excludeButtons")
+RELATED_LIST_CUSTOM_BUTTONS_TEXT = _related_list_text("customButtons")
 
 
 LAYOUT_XML = """<?xml version="1.0" encoding="UTF-8"?>
@@ -37,9 +55,36 @@ RELATED_LIST = """    <relatedLists>
     </relatedLists>
 """
 
+ENCODED_LAYOUT_WITH_RELATED_LIST = LAYOUT_XML.format(relatedLists=RELATED_LIST).encode(
+    "utf-8"
+)
+ENCODED_LAYOUT_WITHOUT_RELATED_LIST = LAYOUT_XML.format(relatedLists="").encode("utf-8")
+
+
+# The layouts are parsed once per module and copied for each test,
+# because _transform_entity() modifies the tree in place.
+@pytest.fixture(scope="module")
+def parsed_layout():
+    return metadata_tree.fromstring(ENCODED_LAYOUT_WITH_RELATED_LIST)._element
+
+
+@pytest.fixture(scope="module")
+def parsed_layout_no_related_lists():
+    return metadata_tree.fromstring(ENCODED_LAYOUT_WITHOUT_RELATED_LIST)._element
+
+
+@pytest.fixture
+def layout(parsed_layout):
+    return metadata_tree.MetadataElement(copy.deepcopy(parsed_layout))
+
+
+@pytest.fixture
+def layout_no_related_lists(parsed_layout_no_related_lists):
+    return metadata_tree.MetadataElement(copy.deepcopy(parsed_layout_no_related_lists))
+
 
 class TestAddRelatedLists:
-    def test_adds_related_list(self):
+    def test_adds_related_list(self, layout):
         task = create_task(
             AddRelatedLists,
             {
@@ -51,23 +96,18 @@ class TestAddRelatedLists:
             },
         )
 
-        tree = metadata_tree.fromstring(
-            LAYOUT_XML.format(relatedLists=RELATED_LIST).encode("utf-8")
-        )
+        tree = layout
         element = tree._element
 
-        assert len(element.findall(f".//{MD}relatedLists[{MD}relatedList='TEST']")) == 0
+        assert len(element.findall(RELATED_LIST_TEST_XPATH)) == 0
 
         task._transform_entity(tree, "Layout")
 
-        assert len(element.findall(f".//{MD}relatedLists[{MD}relatedList='TEST']")) == 1
-        field_elements = element.findall(
-            f".//{MD}relatedLists[{MD}relatedList='TEST']/{MD}fields"
-        )
-        field_names = {elem.text for elem in field_elements}
+        assert len(element.findall(RELATED_LIST_TEST_XPATH)) == 1
+        field_names = set(RELATED_LIST_FIELDS_TEXT(element))
         assert field_names == set(["foo__c", "bar__c"])
 
-    def test_excludes_buttons(self):
+    def test_excludes_buttons(self, layout):
         task = create_task(
             AddRelatedLists,
             {
@@ -80,28 +120,17 @@ class TestAddRelatedLists:
             },
         )
 
-        tree = metadata_tree.fromstring(
-            LAYOUT_XML.format(relatedLists=RELATED_LIST).encode("utf-8")
-        )
+        tree = layout
 
-        assert (
-            len(tree._element.findall(f".//{MD}relatedLists[{MD}relatedList='TEST']"))
-            == 0
-        )
+        assert len(tree._element.findall(RELATED_LIST_TEST_XPATH)) == 0
 
         result = task._transform_entity(tree, "Layout")
 
-        assert (
-            len(result._element.findall(f".//{MD}relatedLists[{MD}relatedList='TEST']"))
-            == 1
-        )
-        button_elements = result._element.findall(
-            f".//{MD}relatedLists[{MD}relatedList='TEST']/{MD}excludeButtons"
-        )
-        excluded_buttons = {elem.text for elem in button_elements}
+        assert len(result._element.findall(RELATED_LIST_TEST_XPATH)) == 1
+        excluded_buttons = set(RELATED_LIST_EXCLUDE_BUTTONS_TEXT(result._element))
         assert excluded_buttons == set(["New", "Edit"])
 
-    def test_includes_buttons(self):
+    def test_includes_buttons(self, layout):
         task = create_task(
             AddRelatedLists,
             {
@@ -114,26 +143,18 @@ class TestAddRelatedLists:
             },
         )
 
-        tree = metadata_tree.fromstring(
-            LAYOUT_XML.format(relatedLists=RELATED_LIST).encode("utf-8")
-        )
+        tree = layout
 
-        assert (
-            len(tree._element.findall(f".//{MD}relatedLists[{MD}relatedList='TEST']"))
-            == 0
-        )
+        assert len(tree._element.findall(RELATED_LIST_TEST_XPATH)) == 0
 
         result = task._transform_entity(tree, "Layout")
         element = result._element
 
-        assert len(element.findall(f".//{MD}relatedLists[{MD}relatedList='TEST']")) == 1
-        button_elements = element.findall(
-            f".//{MD}relatedLists[{MD}relatedList='TEST']/{MD}customButtons"
-        )
-        custom_buttons = {elem.text for elem in button_elements}
+        assert len(element.findall(RELATED_LIST_TEST_XPATH)) == 1
+        custom_buttons = set(RELATED_LIST_CUSTOM_BUTTONS_TEXT(element))
         assert custom_buttons == set(["MyCustomNewAction", "MyCustomEditAction"])
 
-    def test_adds_related_list_no_existing(self):
+    def test_adds_related_list_no_existing(self, layout_no_related_lists):
         task = create_task(
             AddRelatedLists,
             {
@@ -145,23 +166,18 @@ class TestAddRelatedLists:
             },
         )
 
-        tree = metadata_tree.fromstring(
-            LAYOUT_XML.format(relatedLists="").encode("utf-8")
-        )
+        tree = layout_no_related_lists
         element = tree._element
 
-        assert len(element.findall(f".//{MD}relatedLists[{MD}relatedList='TEST']")) == 0
+        assert len(element.findall(RELATED_LIST_TEST_XPATH)) == 0
 
         task._transform_entity(tree, "Layout")
 
-        assert len(element.findall(f".//{MD}relatedLists[{MD}relatedList='TEST']")) == 1
-        field_elements = element.findall(
-            f".//{MD}relatedLists[{MD}relatedList='TEST']/{MD}fields"
-        )
-        field_names = {elem.text for elem in field_elements}
+        assert len(element.findall(RELATED_LIST_TEST_XPATH)) == 1
+        field_names = set(RELATED_LIST_FIELDS_TEXT(element))
         assert field_names == set(["foo__c", "bar__c"])
 
-    def test_skips_existing_related_list(self):
+    def test_skips_existing_related_list(self, layout):
         task = create_task(
             AddRelatedLists,
             {
@@ -173,9 +189,7 @@ class TestAddRelatedLists:
             },
         )
 
-        tree = metadata_tree.fromstring(
-            LAYOUT_XML.format(relatedLists=RELATED_LIST).encode("utf-8")
-        )
+        tree = layout
 
         result = task._transform_entity(tree, "Layout")
 
@@ -270,6 +284,21 @@ EMPTY_ACTION_LIST = """
 </platformActionList>
 """
 
+# The existing action list shared by several tests:
+#   "Record" context, default sort order (0, 1), no additional action items
+ENCODED_LAYOUT_WITH_RECORD_ACTION_LIST = MOCK_EMPTY_LAYOUT.format(
+    action_list_scenario=MOCK_EXISTING_ACTION_LIST.format(
+        0,
+        1,
+        action_list_context="Record",
+        optional_first_action_item="",
+        optional_last_action_item="",
+    )
+).encode("utf-8")
+ENCODED_LAYOUT_WITHOUT_ACTION_LIST = MOCK_EMPTY_LAYOUT.format(
+    action_list_scenario=""
+).encode("utf-8")
+
 
 class TestAddRecordPlatformActionListItem:
     def test_adds_action_item_to_existing_list_place_last(self):
@@ -287,18 +316,7 @@ class TestAddRecordPlatformActionListItem:
         #   "Record" context
         #   default sort order (0, 1)
         #   no optional
-        mock_action_list = MOCK_EXISTING_ACTION_LIST.format(
-            0,
-            1,
-            action_list_context="Record",
-            optional_first_action_item="",
-            optional_last_action_item="",
-        )
-        metadata = metadata_tree.fromstring(
-            MOCK_EMPTY_LAYOUT.format(action_list_scenario=mock_action_list).encode(
-                "utf-8"
-            )
-        )
+        metadata = metadata_tree.fromstring(ENCODED_LAYOUT_WITH_RECORD_ACTION_LIST)
         mock_action_list_size = len(
             metadata._get_child("platformActionList").findall("platformActionListItems")
         )
@@ -343,18 +361,7 @@ class TestAddRecordPlatformActionListItem:
         #   "Record" context
         #   default sort order (0, 1)
         #   no optional
-        mock_action_list = MOCK_EXISTING_ACTION_LIST.format(
-            0,
-            1,
-            action_list_context="Record",
-            optional_first_action_item="",
-            optional_last_action_item="",
-        )
-        metadata = metadata_tree.fromstring(
-            MOCK_EMPTY_LAYOUT.format(action_list_scenario=mock_action_list).encode(
-                "utf-8"
-            )
-        )
+        metadata = metadata_tree.fromstring(ENCODED_LAYOUT_WITH_RECORD_ACTION_LIST)
         mock_action_list_size = len(
             metadata._get_child("platformActionList").findall("platformActionListItems")
         )
@@ -427,9 +434,7 @@ class TestAddRecordPlatformActionListItem:
 
         # Mocks: build our existing action list and create our metadata tree
         #   This is an empty layout without any actionList
-        metadata = metadata_tree.fromstring(
-            MOCK_EMPTY_LAYOUT.format(action_list_scenario="").encode("utf-8")
-        )
+        metadata = metadata_tree.fromstring(ENCODED_LAYOUT_WITHOUT_ACTION_LIST)
 
         # Creating expected action item/list xml and metadata
         #   Expected action list context  = "Record"
@@ -1,16 +1,10 @@
 """ Tests for the connectedapp tasks """
 
-from unittest import mock
+from json import JSONDecodeError
+from unittest.mock import MagicMock
 import os
 import pytest
 import re
-import unittest
-
-try:
-    from json.decoder import JSONDecodeError
-except ImportError:
-    JSONDecodeError = ValueError
-from unittest.mock import MagicMock
 
 from cumulusci.core.config import (
     UniversalConfig,
@@ -21,220 +15,251 @@ from cumulusci.core.config import (
 from cumulusci.core.exceptions import TaskOptionsError
 from cumulusci.core.keychain import BaseProjectKeychain
 from cumulusci.core.keychain import DEFAULT_CONNECTED_APP
-from cumulusci.core.tests.utils import MockLoggerMixin
 from cumulusci.tasks.connectedapp import CreateConnectedApp
-from cumulusci.utils import temporary_dir
+from cumulusci.tasks.sfdx import SFDXBaseTask
 
+LABEL = "Test_Label"
+USERNAME = "TestUser@Name"
+EMAIL = "TestUser@Email"
+OPTIONS = {"label": LABEL, "username": USERNAME, "email": EMAIL}
+OPTIONS_NO_EMAIL = {"label": LABEL, "username": USERNAME}
+OPTIONS_NO_USERNAME = {"label": LABEL, "email": EMAIL}
+# The keychain stores services by reference and these tests only read them.
+GITHUB_SERVICE = ServiceConfig({"email": EMAIL})
+CONNECTED_APP_SERVICE = ServiceConfig(
+    {
+        "callback_url": "http://callback",
+        "client_id": "ClientId",
+        "client_secret": "ClientSecret",
+    }
+)
+BASE_COMMAND = "sfdx force:mdapi:deploy --wait 5"
+WORD_RE = re.compile(r"\A\w+\Z")
 
-class TestCreateConnectedApp(MockLoggerMixin, unittest.TestCase):
-    """Tests for the CreateConnectedApp task"""
 
-    def setUp(self):
-        self.universal_config = UniversalConfig()
-        self.project_config = BaseProjectConfig(
-            self.universal_config, config={"noyaml": True}
-        )
+@pytest.fixture(scope="module")
+def universal_config():
+    # Loading the universal cumulusci.yml is the expensive part of the setup,
+    # and none of these tests modify it.
+    return UniversalConfig()
+
+
+@pytest.fixture
+def project_config(universal_config):
+    project_config = BaseProjectConfig(universal_config, config={"noyaml": True})
+    project_config.set_keychain(BaseProjectKeychain(project_config, ""))
+    return project_config
 
-        keychain = BaseProjectKeychain(self.project_config, "")
-        self.project_config.set_keychain(keychain)
-
-        self._task_log_handler.reset()
-        self.task_log = self._task_log_handler.messages
-        self.label = "Test_Label"
-        self.username = "TestUser@Name"
-        self.email = "TestUser@Email"
-        self.task_config = TaskConfig(
-            {
-                "options": {
-                    "label": self.label,
-                    "username": self.username,
-                    "email": self.email,
-                }
-            }
-        )
 
-    def test_init_options(self):
+# Reset rather than rebuilt for each test that stubs out the sfdx command.
+_RUN_TASK_MOCK = MagicMock()
+
+
+@pytest.fixture
+def run_task_mock(monkeypatch):
+    _RUN_TASK_MOCK.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(SFDXBaseTask, "_run_task", _RUN_TASK_MOCK)
+    return _RUN_TASK_MOCK
+
+
+@pytest.fixture
+def task_config():
+    return TaskConfig({"options": dict(OPTIONS)})
+
+
+class TestCreateConnectedApp:
+    """Tests for the CreateConnectedApp task"""
+
+    def test_init_options(self, project_config, task_config):
         """Passed options are correctly initialized"""
-        self.task_config.config["options"]["connect"] = True
-        self.task_config.config["options"]["overwrite"] = True
-        task = CreateConnectedApp(self.project_config, self.task_config)
-        self.assertEqual(task.options["label"], self.label)
-        self.assertEqual(task.options["username"], self.username)
-        self.assertEqual(task.options["email"], self.email)
-        self.assertIs(task.options["connect"], True)
-        self.assertIs(task.options["overwrite"], True)
-
-    def test_init_options_invalid_label(self):
-        """Non-alphanumeric + _ label raises TaskOptionsError"""
-        self.task_config.config["options"]["label"] = "Test Label"
-        with pytest.raises(TaskOptionsError, match="^label value must contain only"):
-            CreateConnectedApp(self.project_config, self.task_config)
-
-    def test_init_options_email_default(self):
+        task_config.config["options"]["connect"] = True
+        task_config.config["options"]["overwrite"] = True
+        task = CreateConnectedApp(project_config, task_config)
+        assert task.options["label"] == LABEL
+        assert task.options["username"] == USERNAME
+        assert task.options["email"] == EMAIL
+        assert task.options["connect"] is True
+        assert task.options["overwrite"] is True
+
+    @pytest.mark.parametrize(
+        "options,services,match",
+        [
+            # Non-alphanumeric + _ label
+            (
+                {**OPTIONS, "label": "Test Label"},
+                None,
+                "^label value must contain only",
+            ),
+            # no email provided and no github service exists
+            (OPTIONS_NO_EMAIL, {"github": {"attributes": {}}}, "github"),
+        ],
+    )
+    def test_init_options_invalid(self, project_config, options, services, match):
+        """Invalid or missing options raise TaskOptionsError"""
+        task_config = TaskConfig({"options": dict(options)})
+        if services:
+            project_config.config["services"] = services
+        with pytest.raises(TaskOptionsError, match=match):
+            CreateConnectedApp(project_config, task_config)
+
+    def test_init_options_email_default(self, project_config):
         """email option defaults to email from github service"""
-        del self.task_config.config["options"]["email"]
-        self.project_config.config["services"] = {
-            "github": {"attributes": {"email": {}}}
-        }
-        self.project_config.keychain.set_service(
-            "github", "test_alias", ServiceConfig({"email": self.email})
-        )
-        task = CreateConnectedApp(self.project_config, self.task_config)
-        self.assertEqual(task.options["email"], self.email)
-
-    def test_init_options_email_not_found(self):
-        """TaskOptionsError is raised if no email provided and no github service exists"""
-        del self.task_config.config["options"]["email"]
-        self.project_config.config["services"] = {"github": {"attributes": {}}}
-        with pytest.raises(TaskOptionsError, match="github"):
-            CreateConnectedApp(self.project_config, self.task_config)
-
-    @mock.patch("cumulusci.tasks.connectedapp.CreateConnectedApp._run_command")
-    def test_get_command(self, run_command_mock):
-        del self.task_config.config["options"]["username"]
-        task = CreateConnectedApp(self.project_config, self.task_config)
+        task_config = TaskConfig({"options": dict(OPTIONS_NO_EMAIL)})
+        project_config.config["services"] = {"github": {"attributes": {"email": {}}}}
+        project_config.keychain.set_service("github", "test_alias", GITHUB_SERVICE)
+        task = CreateConnectedApp(project_config, task_config)
+        assert task.options["email"] == EMAIL
+
+    def test_get_command(self, project_config, monkeypatch):
+        run_command_mock = MagicMock()
+        monkeypatch.setattr(CreateConnectedApp, "_run_command", run_command_mock)
+        task_config = TaskConfig({"options": dict(OPTIONS_NO_USERNAME)})
+        task = CreateConnectedApp(project_config, task_config)
         run_command_mock.side_effect = lambda **kw: kw["output_handler"](
             b'{"result":[{"value":"username"}]}'
         )
         task.tempdir = "asdf"
         command = task._get_command()
-        assert command == "sfdx force:mdapi:deploy --wait 5 -u username -d asdf"
+        assert command == f"{BASE_COMMAND} -u username -d asdf"
 
-    def test_process_json_output(self):
+    def test_process_json_output(self, project_config, task_config):
         """_process_json_output returns valid json"""
-        task = CreateConnectedApp(self.project_config, self.task_config)
+        task = CreateConnectedApp(project_config, task_config)
         output = task._process_json_output('{"foo":"bar"}')
-        self.assertEqual(output, {"foo": "bar"})
+        assert output == {"foo": "bar"}
 
-    def test_process_json_output_invalid(self):
-        """_process_json_output with invalid input logs output and raises JSONDecodeError"""
-        task = CreateConnectedApp(self.project_config, self.task_config)
+    def test_process_json_output_invalid(self, project_config, task_config):
+        """_process_json_output with invalid input raises JSONDecodeError"""
+        task = CreateConnectedApp(project_config, task_config)
         with pytest.raises(JSONDecodeError):
             task._process_json_output("invalid")
-        self.assertEqual(
-            self.task_log["error"], ["Failed to parse json from output: invalid"]
-        )
 
-    @mock.patch(
-        "cumulusci.tasks.connectedapp.CreateConnectedApp._set_default_username",
-        MagicMock(return_value=None),
-    )
-    def test_process_devhub_output(self):
+    def test_process_json_output_invalid__logs_output(
+        self, project_config, task_config, caplog
+    ):
+        """_process_json_output with invalid input logs the output it failed to parse"""
+        task = CreateConnectedApp(project_config, task_config)
+        with pytest.raises(JSONDecodeError):
+            task._process_json_output("invalid")
+        assert [
+            record.getMessage()
+            for record in caplog.records
+            if record.levelname == "ERROR"
+        ] == ["Failed to parse json from output: invalid"]
+
+    def test_process_devhub_output(self, project_config, monkeypatch):
         """username is parsed from json response"""
-        del self.task_config.config["options"]["username"]
-        task = CreateConnectedApp(self.project_config, self.task_config)
-        task._process_devhub_output('{"result":[{"value":"' + self.username + '"}]}')
-        self.assertEqual(task.options.get("username"), self.username)
-
-    @mock.patch(
-        "cumulusci.tasks.connectedapp.CreateConnectedApp._set_default_username",
-        MagicMock(return_value=None),
-    )
-    def test_process_devhub_output_not_configured(self):
+        monkeypatch.setattr(
+            CreateConnectedApp, "_set_default_username", MagicMock(return_value=None)
+        )
+        task_config = TaskConfig({"options": dict(OPTIONS_NO_USERNAME)})
+        task = CreateConnectedApp(project_config, task_config)
+        task._process_devhub_output('{"result":[{"value":"' + USERNAME + '"}]}')
+        assert task.options.get("username") == USERNAME
+
+    def test_process_devhub_output_not_configured(self, project_config, monkeypatch):
         """TaskOptionsError is raised if no username provided and no default found"""
-        del self.task_config.config["options"]["username"]
-        task = CreateConnectedApp(self.project_config, self.task_config)
+        monkeypatch.setattr(
+            CreateConnectedApp, "_set_default_username", MagicMock(return_value=None)
+        )
+        task_config = TaskConfig({"options": dict(OPTIONS_NO_USERNAME)})
+        task = CreateConnectedApp(project_config, task_config)
         with pytest.raises(TaskOptionsError, match="^No sfdx config found"):
             task._process_devhub_output('{"result":[{}]}')
 
-    def test_generate_id_and_secret(self):
+    def test_generate_id_and_secret(self, project_config, task_config):
         """client_id and client_secret are generated correctly"""
-        task = CreateConnectedApp(self.project_config, self.task_config)
+        task = CreateConnectedApp(project_config, task_config)
         task._generate_id_and_secret()
-        self.assertEqual(len(task.client_id), task.client_id_length)
-        self.assertEqual(len(task.client_secret), task.client_secret_length)
-        self.assertNotEqual(re.match(r"^\w+$", task.client_id), None)
-        self.assertNotEqual(re.match(r"^\w+$", task.client_secret), None)
+        assert len(task.client_id) == task.client_id_length
+        assert len(task.client_secret) == task.client_secret_length
+        assert WORD_RE.match(task.client_id)
+        assert WORD_RE.match(task.client_secret)
 
-    def test_build_package(self):
+    def test_build_package(self, project_config, task_config, tmp_path, monkeypatch):
         """tempdir is populated with connected app and package.xml"""
-        task = CreateConnectedApp(self.project_config, self.task_config)
-        with temporary_dir() as tempdir:
-            task.tempdir = tempdir
-            connected_app_path = os.path.join(
-                task.tempdir, "connectedApps", "{}.connectedApp".format(self.label)
-            )
-            task._build_package()
-            self.assertTrue(os.path.isdir(os.path.join(task.tempdir, "connectedApps")))
-            self.assertTrue(os.path.isfile(os.path.join(task.tempdir, "package.xml")))
-            self.assertTrue(os.path.isfile(connected_app_path))
-            with open(connected_app_path, "r") as f:
-                connected_app = f.read()
-                self.assertTrue("<label>{}<".format(self.label) in connected_app)
-                self.assertTrue("<contactEmail>{}<".format(self.email) in connected_app)
-                self.assertTrue(
-                    "<consumerKey>{}<".format(task.client_id) in connected_app
-                )
-                self.assertTrue(
-                    "<consumerSecret>{}<".format(task.client_secret) in connected_app
-                )
-
-    def test_connect_service(self):
+        task = CreateConnectedApp(project_config, task_config)
+        task.tempdir = str(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        connected_app_path = tmp_path / "connectedApps" / f"{LABEL}.connectedApp"
+        task._build_package()
+        assert (tmp_path / "connectedApps").is_dir()
+        assert (tmp_path / "package.xml").is_file()
+        assert connected_app_path.is_file()
+        connected_app = connected_app_path.read_text()
+        # Needles are listed in document order so the file is scanned once.
+        pos = 0
+        for needle in (
+            f"<contactEmail>{EMAIL}<",
+            f"<label>{LABEL}<",
+            f"<consumerKey>{task.client_id}<",
+            f"<consumerSecret>{task.client_secret}<",
+        ):
+            pos = connected_app.find(needle, pos)
+            assert pos != -1, needle
+            pos += len(needle)
+
+    def test_connect_service(self, project_config, task_config):
         """connected app gets added to the keychain connected_app service"""
-        self.project_config.config["services"] = {
+        project_config.config["services"] = {
             "connected_app": {
                 "attributes": {"callback_url": {}, "client_id": {}, "client_secret": {}}
             }
         }
-        task = CreateConnectedApp(self.project_config, self.task_config)
+        task = CreateConnectedApp(project_config, task_config)
         task._connect_service()
-        connected_app = self.project_config.keychain.get_service(
-            "connected_app", self.label
-        )
+        connected_app = project_config.keychain.get_service("connected_app", LABEL)
         assert connected_app.callback_url == "http://localhost:8080/callback"
         assert connected_app.client_id == task.client_id
         assert connected_app.client_secret == task.client_secret
 
-    def test_validate_service_overwrite_false(self):
+    def test_validate_service_overwrite_false(self, project_config, task_config):
         """attempting to overwrite connected_app service without overwrite = True fails"""
-        self.project_config.config["services"] = {
+        project_config.config["services"] = {
             "connected_app": {
                 "attributes": {"callback_url": {}, "client_id": {}, "client_secret": {}}
             }
         }
-        self.project_config.keychain.set_service(
+        project_config.keychain.set_service(
             "connected_app",
-            self.label,
-            ServiceConfig(
-                {
-                    "callback_url": "http://callback",
-                    "client_id": "ClientId",
-                    "client_secret": "ClientSecret",
-                }
-            ),
+            LABEL,
+            CONNECTED_APP_SERVICE,
         )
-        task = CreateConnectedApp(self.project_config, self.task_config)
+        task = CreateConnectedApp(project_config, task_config)
         with pytest.raises(
             TaskOptionsError, match="^The CumulusCI keychain already contains"
         ):
             task._validate_connect_service()
 
-    @mock.patch("cumulusci.tasks.sfdx.SFDXBaseTask._run_task")
-    def test_run_task(self, run_task_mock):
+    def test_run_task(self, project_config, task_config, run_task_mock):
         """_run_task formats command, calls SFDXBaseTask._run_task, and does not connect service by default"""
-        self.project_config.config["services"] = {
+        project_config.config["services"] = {
             "connected_app": {
                 "attributes": {"callback_url": {}, "client_id": {}, "client_secret": {}}
             }
         }
-        task = CreateConnectedApp(self.project_config, self.task_config)
+        task = CreateConnectedApp(project_config, task_config)
         task._run_task()
         run_task_mock.assert_called_once()
-        self.assertFalse(os.path.isdir(task.tempdir))
-        connected_app = self.project_config.keychain.get_service("connected_app")
+        assert not os.path.isdir(task.tempdir)
+        connected_app = project_config.keychain.get_service("connected_app")
         assert connected_app is DEFAULT_CONNECTED_APP
 
-    @mock.patch("cumulusci.tasks.sfdx.SFDXBaseTask._run_task")
-    @mock.patch("cumulusci.tasks.connectedapp.CreateConnectedApp._connect_service")
-    def test_run_task_connect(self, run_task_mock, connect_service_mock):
+    def test_run_task_connect(
+        self, project_config, task_config, run_task_mock, monkeypatch
+    ):
         """_run_task calls _connect_service if connect option is True"""
-        self.project_config.config["services"] = {
+        connect_service_mock = MagicMock()
+        monkeypatch.setattr(
+            CreateConnectedApp, "_connect_service", connect_service_mock
+        )
+        project_config.config["services"] = {
             "connected_app": {
                 "attributes": {"callback_url": {}, "client_id": {}, "client_secret": {}}
             }
         }
-        self.task_config.config["options"]["connect"] = True
-        task = CreateConnectedApp(self.project_config, self.task_config)
+        task_config.config["options"]["connect"] = True
+        task = CreateConnectedApp(project_config, task_config)
         task._run_task()
         run_task_mock.assert_called_once()
         connect_service_mock.assert_called_once()
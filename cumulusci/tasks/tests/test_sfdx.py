@@ -14,7 +14,6 @@ from cumulusci.core.config import ScratchOrgConfig
 from cumulusci.core.keychain import BaseProjectKeychain
 from cumulusci.core.tests.utils import MockLoggerMixin
 
-from cumulusci.tasks.command import CommandException
 from cumulusci.tasks.salesforce.tests.util import create_task
 from cumulusci.tasks.sfdx import SFDXBaseTask
 from cumulusci.tasks.sfdx import SFDXOrgTask
@@ -43,11 +42,6 @@ class TestSFDXBaseTask(MockLoggerMixin, unittest.TestCase):
         self.task_config.config["options"] = {"command": "force:org", "extra": "--help"}
         task = SFDXBaseTask(self.project_config, self.task_config)
 
-        try:
-            task()
-        except CommandException:
-            pass
-
         self.assertEqual("force:org", task.options["command"])
         self.assertEqual("sfdx force:org --help", task._get_command())
 
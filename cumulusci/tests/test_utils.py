@@ -9,7 +9,9 @@ from datetime import datetime
 
 from xml.etree import ElementTree as ET
 from unittest import mock
+import requests
 import responses
+import tempfile
 
 from cumulusci import utils
 from cumulusci.core.config import TaskConfig, FlowConfig
@@ -339,6 +341,35 @@ Options\n------------------------------------------\n\n
             utils.download_extract_zip("http://test", target=d)
             assert "test" in os.listdir(d)
 
+    @responses.activate
+    def test_download_extract_zip_to_target__closes_files(self):
+        with utils.temporary_dir() as d:
+            f = io.BytesIO()
+            with zipfile.ZipFile(f, "w") as zf:
+                zf.writestr("test", "test")
+            responses.add(method=responses.GET, url="http://test", body=f.getvalue())
+            temp_files = []
+            TemporaryFile = tempfile.TemporaryFile
+
+            def temporary_file():
+                temp_files.append(TemporaryFile())
+                return temp_files[-1]
+
+            with mock.patch.object(
+                requests.Response, "close", autospec=True
+            ) as close, mock.patch("tempfile.TemporaryFile", temporary_file):
+                utils.download_extract_zip("http://test", target=d)
+
+            close.assert_called_once()
+            assert [temp_file.closed for temp_file in temp_files] == [True]
+            assert "test" in os.listdir(d)
+
+    @responses.activate
+    def test_download_extract_zip__error(self):
+        responses.add(method=responses.GET, url="http://test", status=404)
+        with pytest.raises(requests.exceptions.HTTPError):
+            utils.download_extract_zip("http://test")
+
     def test_download_extract_github(self):
         f = io.BytesIO()
         with zipfile.ZipFile(f, "w") as zf:
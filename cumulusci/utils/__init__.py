@@ -26,6 +26,7 @@ META_XML_CLEAN_DIRS = ("classes/", "triggers/", "pages/", "aura/", "components/"
 API_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
 DATETIME_LEN = len("2018-08-07T16:00:56.000")
 UTF8 = "UTF-8"
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 BREW_UPDATE_CMD = "brew upgrade cumulusci"
 PIP_UPDATE_CMD = "pip install --upgrade cumulusci"
@@ -162,15 +163,24 @@ def remove_xml_element(name, tree):
 def download_extract_zip(url, target=None, subfolder=None, headers=None):
     if not headers:
         headers = {}
-    resp = requests.get(url, headers=headers)
-    zip_content = io.BytesIO(resp.content)
-    zip_file = zipfile.ZipFile(zip_content)
-    if subfolder:
-        zip_file = zip_subfolder(zip_file, subfolder)
-    if target:
-        zip_file.extractall(target)
-        return
-    return zip_file
+    with requests.get(url, headers=headers, stream=True) as resp:
+        resp.raise_for_status()
+        # Spool the archive to disk rather than holding it in memory
+        with tempfile.TemporaryFile() as zip_content:
+            for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                zip_content.write(chunk)
+            with zipfile.ZipFile(zip_content) as zip_file:
+                if subfolder:
+                    zip_file = zip_subfolder(zip_file, subfolder)
+                if target:
+                    zip_file.extractall(target)
+                    return
+                if subfolder:
+                    return zip_file
+                # The temporary file is closed on return, so hand back
+                # an in-memory copy of the archive.
+                zip_content.seek(0)
+                return zipfile.ZipFile(io.BytesIO(zip_content.read()))
 
 
 def download_extract_github(
@@ -184,14 +194,15 @@ def download_extract_github(
 def download_extract_github_from_repo(github_repo, subfolder=None, ref=None):
     if not ref:
         ref = github_repo.default_branch
-    zip_content = io.BytesIO()
-    github_repo.archive("zipball", zip_content, ref=ref)
-    zip_file = zipfile.ZipFile(zip_content)
-    path = sorted(zip_file.namelist())[0]
-    if subfolder:
-        path = path + subfolder
-    zip_file = zip_subfolder(zip_file, path)
-    return zip_file
+    # Spool the archive of the whole repository to disk;
+    # only the requested subfolder is kept in memory.
+    with tempfile.TemporaryFile() as zip_content:
+        github_repo.archive("zipball", zip_content, ref=ref)
+        with zipfile.ZipFile(zip_content) as zip_file:
+            path = sorted(zip_file.namelist())[0]
+            if subfolder:
+                path = path + subfolder
+            return zip_subfolder(zip_file, path)
 
 
 def process_text_in_directory(path, process_file):